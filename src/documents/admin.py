@@ -71,6 +71,10 @@ class DocumentAdmin(GuardedModelAdmin):
     def has_add_permission(self, request):
         return False
 
+    def get_queryset(self, request):
+        # Document.__str__ reads the correspondent, e.g. for delete confirmations
+        return super().get_queryset(request).select_related("correspondent")
+
     def created_(self, obj):
         return obj.created.date().strftime("%Y-%m-%d")
 
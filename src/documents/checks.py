@@ -31,7 +31,10 @@ def changed_password_check(app_configs, **kwargs):
                 ),
             ]
 
-        if not GnuPG.decrypted(encrypted_doc.source_file):
+        with encrypted_doc.open_source() as file_handle:
+            decrypted = GnuPG.decrypted(file_handle)
+
+        if not decrypted:
             return [
                 Error(
                     textwrap.dedent(
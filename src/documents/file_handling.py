@@ -110,10 +110,14 @@ def generate_unique_filename(doc, archive_filename=False):
             return new_filename
 
     counter = 0
+    # The formatted path doesn't depend on the counter, so it is only
+    # generated once, however many candidates have to be tried
+    path = _format_filename_path(doc)
 
     while True:
-        new_filename = generate_filename(
+        new_filename = _build_filename(
             doc,
+            path,
             counter,
             archive_filename=archive_filename,
         )
@@ -133,6 +137,21 @@ def generate_filename(
     append_gpg=True,
     archive_filename=False,
 ):
+    return _build_filename(
+        doc,
+        _format_filename_path(doc),
+        counter,
+        append_gpg=append_gpg,
+        archive_filename=archive_filename,
+    )
+
+
+def _format_filename_path(doc: Document) -> str:
+    """
+    Formats the document's filename path from its storage path or
+    FILENAME_FORMAT, without counter or extension. Returns an empty string
+    if there is no format or the format is invalid.
+    """
     path = ""
     filename_format = settings.FILENAME_FORMAT
 
@@ -234,6 +253,16 @@ def generate_filename(
             f"Invalid filename_format '{filename_format}', falling back to default",
         )
 
+    return path
+
+
+def _build_filename(
+    doc: Document,
+    path: str,
+    counter=0,
+    append_gpg=True,
+    archive_filename=False,
+):
     counter_str = f"_{counter:02}" if counter else ""
 
     filetype_str = ".pdf" if archive_filename else doc.file_type
@@ -62,9 +62,9 @@ class Command(BaseCommand):
 
             old_paths = [document.source_path, document.thumbnail_path]
 
-            with document.source_file as file_handle:
+            with document.open_source() as file_handle:
                 raw_document = GnuPG.decrypted(file_handle, passphrase)
-            with document.thumbnail_file as file_handle:
+            with document.open_thumbnail() as file_handle:
                 raw_thumb = GnuPG.decrypted(file_handle, passphrase)
 
             document.storage_type = Document.STORAGE_TYPE_UNENCRYPTED
@@ -88,6 +88,7 @@ class Command(BaseCommand):
             Document.objects.filter(id=document.id).update(
                 storage_type=document.storage_type,
                 filename=document.filename,
+                filename_hash=Document.hash_filename(document.filename),
             )
 
             for path in old_paths:
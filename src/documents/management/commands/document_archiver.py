@@ -61,12 +61,10 @@ class Command(MultiProcessMixin, ProgressBarMixin, BaseCommand):
         else:
             documents = Document.objects.all()
 
-        document_ids = list(
-            map(
-                lambda doc: doc.id,
-                filter(lambda d: overwrite or not d.has_archive_version, documents),
-            ),
-        )
+        if not overwrite:
+            documents = documents.filter(archive_filename__isnull=True)
+
+        document_ids = list(documents.values_list("id", flat=True))
 
         # Note to future self: this prevents django from reusing database
         # connections between processes, which is bad and does not work
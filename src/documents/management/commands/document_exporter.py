@@ -367,19 +367,19 @@ class Command(BaseCommand):
                 t = int(time.mktime(document.created.timetuple()))
 
                 original_target.parent.mkdir(parents=True, exist_ok=True)
-                with document.source_file as out_file:
+                with document.open_source() as out_file:
                     original_target.write_bytes(GnuPG.decrypted(out_file))
                     os.utime(original_target, times=(t, t))
 
                 if thumbnail_target:
                     thumbnail_target.parent.mkdir(parents=True, exist_ok=True)
-                    with document.thumbnail_file as out_file:
+                    with document.open_thumbnail() as out_file:
                         thumbnail_target.write_bytes(GnuPG.decrypted(out_file))
                         os.utime(thumbnail_target, times=(t, t))
 
                 if archive_target:
                     archive_target.parent.mkdir(parents=True, exist_ok=True)
-                    with document.archive_path as out_file:
+                    with document.open_archive() as out_file:
                         archive_target.write_bytes(GnuPG.decrypted(out_file))
                         os.utime(archive_target, times=(t, t))
             else:
@@ -1,6 +1,7 @@
 import logging
 import re
 from fnmatch import fnmatch
+from functools import lru_cache
 
 from documents.classifier import DocumentClassifier
 from documents.data_models import ConsumableDocument
@@ -193,11 +194,8 @@ def matches(matching_model: MatchingModel, document: Document):
     elif matching_model.matching_algorithm == MatchingModel.MATCH_FUZZY:
         from rapidfuzz import fuzz
 
-        match = re.sub(r"[^\w\s]", "", matching_model.match)
-        text = re.sub(r"[^\w\s]", "", document_content)
-        if matching_model.is_insensitive:
-            match = match.lower()
-            text = text.lower()
+        match = _normalize_fuzzy(matching_model.match, matching_model.is_insensitive)
+        text = _normalize_fuzzy(document_content, matching_model.is_insensitive)
         if fuzz.partial_ratio(match, text, score_cutoff=90):
             # TODO: make this better
             log_reason(
@@ -218,6 +216,23 @@ def matches(matching_model: MatchingModel, document: Document):
         raise NotImplementedError("Unsupported matching algorithm")
 
 
+_FUZZY_IGNORED_CHARS = re.compile(r"[^\w\s]")
+
+
+@lru_cache(maxsize=4)
+def _normalize_fuzzy(text: str, insensitive: bool) -> str:
+    """
+    Strips punctuation (and case, if requested) before fuzzy matching.
+
+    A document is checked against every fuzzy matching model in turn, so the
+    normalized content is cached instead of being rebuilt for each of them.
+    """
+    text = _FUZZY_IGNORED_CHARS.sub("", text)
+    if insensitive:
+        text = text.lower()
+    return text
+
+
 def _split_match(matching_model):
     """
     Splits the match to individual keywords, getting rid of unnecessary
@@ -0,0 +1,60 @@
+# Generated by Django 4.2.7 on 2026-10-15 08:10
+
+import logging
+
+from django.db import DatabaseError
+from django.db import migrations
+from django.db import transaction
+
+logger = logging.getLogger("paperless.migrations")
+
+# Trigram indexes allow PostgreSQL to use an index for the title and content
+# icontains filters (documents.filters.TitleContentFilter and the title
+# filters). Django compiles those to UPPER("col"::text) LIKE UPPER(%s), so the
+# indexes have to be on that same expression to be usable. Other database
+# backends have no equivalent, so these are only created on PostgreSQL.
+TRIGRAM_INDEXES = [
+    ("documents_document_title_trgm", "documents_document", "title"),
+    ("documents_document_content_trgm", "documents_document", "content"),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except DatabaseError as e:
+        logger.warning(
+            f"Unable to enable the pg_trgm extension, skipping trigram indexes: {e}",
+        )
+        return
+
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+            f"USING gin ((UPPER({column}::text)) gin_trgm_ops)",
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for name, _, _ in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "1042_consumptiontemplate_assign_custom_fields_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            code=create_trigram_indexes,
+            reverse_code=drop_trigram_indexes,
+        ),
+    ]
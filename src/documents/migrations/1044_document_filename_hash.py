@@ -0,0 +1,66 @@
+# Generated by Django 4.2.7 on 2026-10-15 08:08
+
+import hashlib
+
+from django.db import migrations
+from django.db import models
+
+
+def set_filename_hash(apps, schema_editor):
+    Document = apps.get_model("documents", "Document")
+
+    documents = []
+    for document in (
+        Document.objects.filter(filename__isnull=False).only("filename").iterator()
+    ):
+        document.filename_hash = hashlib.blake2b(
+            document.filename.encode(),
+            digest_size=16,
+        ).hexdigest()
+        documents.append(document)
+
+    Document.objects.bulk_update(documents, ["filename_hash"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "1043_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="document",
+            name="filename_hash",
+            field=models.CharField(
+                default=None,
+                editable=False,
+                help_text="Hash of the current filename in storage",
+                max_length=32,
+                null=True,
+                verbose_name="filename hash",
+            ),
+        ),
+        migrations.RunPython(
+            code=set_filename_hash,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AddConstraint(
+            model_name="document",
+            constraint=models.UniqueConstraint(
+                fields=("filename_hash",),
+                name="documents_document_filename_hash_uniq",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="document",
+            name="filename",
+            field=models.FilePathField(
+                default=None,
+                editable=False,
+                help_text="Current filename in storage",
+                max_length=1024,
+                null=True,
+                verbose_name="filename",
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.7 on 2026-10-15 08:09
+
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "1044_document_filename_hash"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="document",
+            index=models.Index(
+                fields=["archive_checksum"],
+                name="documents_d_archive_7ea7fd_idx",
+            ),
+        ),
+    ]
@@ -1,8 +1,9 @@
-import datetime
+import hashlib
 import logging
 import os
 import re
-from collections import OrderedDict
+import warnings
+from functools import lru_cache
 from pathlib import Path
 from typing import Final
 from typing import Optional
@@ -26,6 +27,10 @@ if settings.AUDIT_LOG_ENABLED:
 from documents.data_models import DocumentSource
 from documents.parsers import get_default_file_extension
 
+# Same behaviour as pathvalidate.sanitize_filename(), which builds a new
+# sanitizer and validator on every call
+_FILENAME_SANITIZER: Final = pathvalidate.FileNameSanitizer()
+
 
 class ModelWithOwner(models.Model):
     owner = models.ForeignKey(
@@ -130,6 +135,21 @@ class StoragePath(MatchingModel):
         verbose_name_plural = _("storage paths")
 
 
+class DocumentManager(models.Manager):
+    """
+    Loads the related objects that listing and serializing documents reads,
+    so this is done with a fixed number of queries instead of per document.
+    """
+
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .select_related("correspondent", "document_type", "storage_path", "owner")
+            .prefetch_related("tags", "notes")
+        )
+
+
 class Document(ModelWithOwner):
     STORAGE_TYPE_UNENCRYPTED = "unencrypted"
     STORAGE_TYPE_GPG = "gpg"
@@ -231,11 +251,20 @@ class Document(ModelWithOwner):
         max_length=1024,
         editable=False,
         default=None,
-        unique=True,
         null=True,
         help_text=_("Current filename in storage"),
     )
 
+    # Enforces unique filenames with a far smaller index than one on filename
+    filename_hash = models.CharField(
+        _("filename hash"),
+        max_length=32,
+        editable=False,
+        default=None,
+        null=True,
+        help_text=_("Hash of the current filename in storage"),
+    )
+
     archive_filename = models.FilePathField(
         _("archive filename"),
         max_length=1024,
@@ -274,22 +303,69 @@ class Document(ModelWithOwner):
         ),
     )
 
+    objects = models.Manager()
+
+    objects_with_related = DocumentManager()
+
     class Meta:
         ordering = ("-created",)
         verbose_name = _("document")
         verbose_name_plural = _("documents")
+        constraints = [
+            # Declared here rather than with unique=True, so PostgreSQL doesn't
+            # also get a varchar_pattern_ops index nothing would use
+            models.UniqueConstraint(
+                fields=["filename_hash"],
+                name="documents_document_filename_hash_uniq",
+            ),
+        ]
+        indexes = [
+            # As above, a Meta index avoids the extra varchar_pattern_ops index
+            models.Index(fields=["archive_checksum"]),
+        ]
 
     def __str__(self) -> str:
         # Convert UTC database time to local time
-        created = datetime.date.isoformat(timezone.localdate(self.created))
-
-        res = f"{created}"
+        parts = [timezone.localdate(self.created).isoformat()]
 
-        if self.correspondent:
-            res += f" {self.correspondent}"
+        # Checking the id avoids fetching the correspondent just to test it
+        if self.correspondent_id:
+            parts.append(str(self.correspondent))
         if self.title:
-            res += f" {self.title}"
-        return res
+            parts.append(self.title)
+        return " ".join(parts)
+
+    def save(self, *args, **kwargs):
+        self.filename_hash = self.hash_filename(self.filename)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "filename" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "filename_hash"}
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def hash_filename(filename: Optional[str]) -> Optional[str]:
+        """
+        Returns the value stored in filename_hash for the given filename.
+        Code that updates filename through a queryset must store this as well.
+        """
+        if filename is None:
+            return None
+        return hashlib.blake2b(str(filename).encode(), digest_size=16).hexdigest()
+
+    def _resolve_cached(self, cache_name: str, directory: Path, name: str) -> Path:
+        """
+        Resolves name inside directory, keeping the result on the instance.
+        Resolving queries the file system, so repeated access to the same
+        path is served from the cache for as long as its inputs are unchanged.
+        """
+        key = (directory, name)
+        cached = self.__dict__.get(cache_name)
+        if cached is None or cached[0] != key:
+            # Cheaper than building and resolving a Path one segment at a time
+            resolved = os.path.realpath(os.path.join(directory, name))
+            cached = (key, Path(resolved))
+            self.__dict__[cache_name] = cached
+        return cached[1]
 
     @property
     def source_path(self) -> Path:
@@ -300,11 +376,23 @@ class Document(ModelWithOwner):
             if self.storage_type == self.STORAGE_TYPE_GPG:
                 fname += ".gpg"  # pragma: no cover
 
-        return (settings.ORIGINALS_DIR / Path(fname)).resolve()
+        return self._resolve_cached("_source_path", settings.ORIGINALS_DIR, fname)
+
+    def open_source(self):
+        """
+        Opens the original file for reading. The caller is responsible for
+        closing it, preferably by using the result as a context manager.
+        """
+        return open(self.source_path, "rb")
 
     @property
     def source_file(self):
-        return open(self.source_path, "rb")
+        warnings.warn(
+            "Document.source_file is deprecated, use Document.open_source()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.open_source()
 
     @property
     def has_archive_version(self) -> bool:
@@ -313,13 +401,29 @@ class Document(ModelWithOwner):
     @property
     def archive_path(self) -> Optional[Path]:
         if self.has_archive_version:
-            return (settings.ARCHIVE_DIR / Path(str(self.archive_filename))).resolve()
+            return self._resolve_cached(
+                "_archive_path",
+                settings.ARCHIVE_DIR,
+                str(self.archive_filename),
+            )
         else:
             return None
 
+    def open_archive(self):
+        """
+        Opens the archived file for reading. The caller is responsible for
+        closing it, preferably by using the result as a context manager.
+        """
+        return open(self.archive_path, "rb")
+
     @property
     def archive_file(self):
-        return open(self.archive_path, "rb")
+        warnings.warn(
+            "Document.archive_file is deprecated, use Document.open_archive()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.open_archive()
 
     def get_public_filename(self, archive=False, counter=0, suffix=None) -> str:
         """
@@ -338,7 +442,7 @@ class Document(ModelWithOwner):
         else:
             result += self.file_type
 
-        return pathvalidate.sanitize_filename(result, replacement_text="-")
+        return _FILENAME_SANITIZER.sanitize(result, replacement_text="-")
 
     @property
     def file_type(self):
@@ -350,13 +454,27 @@ class Document(ModelWithOwner):
         if self.storage_type == self.STORAGE_TYPE_GPG:
             webp_file_name += ".gpg"
 
-        webp_file_path = settings.THUMBNAIL_DIR / Path(webp_file_name)
+        return self._resolve_cached(
+            "_thumbnail_path",
+            settings.THUMBNAIL_DIR,
+            webp_file_name,
+        )
 
-        return webp_file_path.resolve()
+    def open_thumbnail(self):
+        """
+        Opens the thumbnail file for reading. The caller is responsible for
+        closing it, preferably by using the result as a context manager.
+        """
+        return open(self.thumbnail_path, "rb")
 
     @property
     def thumbnail_file(self):
-        return open(self.thumbnail_path, "rb")
+        warnings.warn(
+            "Document.thumbnail_file is deprecated, use Document.open_thumbnail()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.open_thumbnail()
 
     @property
     def created_date(self):
@@ -476,23 +594,66 @@ class SavedViewFilterRule(models.Model):
         return f"SavedViewFilterRule: {self.rule_type} : {self.value}"
 
 
+_SCOPED_FLAG_LETTERS: Final = {
+    re.ASCII: "a",
+    re.IGNORECASE: "i",
+    re.MULTILINE: "m",
+    re.DOTALL: "s",
+}
+_INLINE_GLOBAL_FLAGS: Final = re.compile(r"\(\?[aiLmsux]+\)")
+# Backreferences (\1) and conditionals ((?(1)...)) which refer to a group by
+# number, and would point at a different group once the patterns are combined
+_NUMBERED_GROUP_REFERENCE: Final = re.compile(r"\\[1-9]|\(\?\(\d")
+
+
+@lru_cache(maxsize=8)
+def _combine_filename_parse_transforms(
+    patterns: tuple[re.Pattern, ...],
+) -> Optional[re.Pattern]:
+    """
+    Joins the patterns of FILENAME_PARSE_TRANSFORMS into a single alternation,
+    so a filename is scanned once instead of once per configured transform.
+    Each pattern is wrapped in a named group t<index>, so the match tells
+    which transform was found.
+
+    Returns None if there is nothing to gain or if the patterns cannot be
+    combined without changing their meaning.
+    """
+    if len(patterns) < 2:
+        return None
+
+    alternatives = []
+    for index, pattern in enumerate(patterns):
+        if (
+            not isinstance(pattern.pattern, str)
+            or pattern.flags & re.VERBOSE
+            or _INLINE_GLOBAL_FLAGS.search(pattern.pattern)
+            or _NUMBERED_GROUP_REFERENCE.search(pattern.pattern)
+        ):
+            return None
+        flags = "".join(
+            letter
+            for flag, letter in _SCOPED_FLAG_LETTERS.items()
+            if pattern.flags & flag
+        )
+        alternatives.append(f"(?P<t{index}>(?{flags}:{pattern.pattern}))")
+
+    try:
+        return re.compile("|".join(alternatives))
+    except re.error:
+        # Most likely duplicate group names across the configured patterns
+        return None
+
+
 # TODO: why is this in the models file?
 # TODO: how about, what is this and where is it documented?
 # It appears to parsing JSON from an environment variable to get a title and date from
 # the filename, if possible, as a higher priority than either document filename or
 # content parsing
 class FileInfo:
-    REGEXES = OrderedDict(
-        [
-            (
-                "created-title",
-                re.compile(
-                    r"^(?P<created>\d{8}(\d{6})?Z) - (?P<title>.*)$",
-                    flags=re.IGNORECASE,
-                ),
-            ),
-            ("title", re.compile(r"(?P<title>.*)$", flags=re.IGNORECASE)),
-        ],
+    REGEX = re.compile(
+        r"^(?:(?P<created>\d{8}(?:\d{6})?Z) - (?P<created_title>.*)|(?P<title>.*))$",
+        flags=re.IGNORECASE,
     )
 
     def __init__(
@@ -520,16 +681,21 @@ class FileInfo:
     def _get_title(cls, title):
         return title
 
-    @classmethod
-    def _mangle_property(cls, properties, name):
-        if name in properties:
-            properties[name] = getattr(cls, f"_get_{name}")(properties[name])
-
     @classmethod
     def from_filename(cls, filename) -> "FileInfo":
         # Mutate filename in-place before parsing its components
         # by applying at most one of the configured transformations.
-        for pattern, repl in settings.FILENAME_PARSE_TRANSFORMS:
+        transforms = settings.FILENAME_PARSE_TRANSFORMS
+        combined = _combine_filename_parse_transforms(
+            tuple(pattern for pattern, _ in transforms),
+        )
+        if combined is not None:
+            # The leftmost match limits which transforms can apply: none at
+            # all if nothing matched, otherwise none after the matched one.
+            # Earlier transforms may still match further into the filename.
+            m = combined.search(filename)
+            transforms = transforms[: int(m.lastgroup[1:]) + 1] if m else ()
+        for pattern, repl in transforms:
             (filename, count) = pattern.subn(repl, filename)
             if count:
                 break
@@ -552,13 +718,14 @@ class FileInfo:
             filename = filename_no_ext
 
         # Parse filename components.
-        for regex in cls.REGEXES.values():
-            m = regex.match(filename)
-            if m:
-                properties = m.groupdict()
-                cls._mangle_property(properties, "created")
-                cls._mangle_property(properties, "title")
-                return cls(**properties)
+        m = cls.REGEX.match(filename)
+        if m:
+            if m["created"] is not None:
+                return cls(
+                    created=cls._get_created(m["created"]),
+                    title=cls._get_title(m["created_title"]),
+                )
+            return cls(title=cls._get_title(m["title"]))
 
 
 # Extending User Model Using a One-To-One Link
@@ -575,8 +742,8 @@ class UiSettings(models.Model):
 
 
 class PaperlessTask(models.Model):
-    ALL_STATES = sorted(states.ALL_STATES)
-    TASK_STATE_CHOICES = sorted(zip(ALL_STATES, ALL_STATES))
+    ALL_STATES = tuple(sorted(states.ALL_STATES))
+    TASK_STATE_CHOICES = tuple((state, state) for state in ALL_STATES)
 
     task_id = models.CharField(
         max_length=255,
@@ -57,7 +57,7 @@ def is_mime_type_supported(mime_type: str) -> bool:
     return get_parser_class_for_mime_type(mime_type) is not None
 
 
-@lru_cache(maxsize=8)
+@lru_cache(maxsize=128)
 def get_default_file_extension(mime_type: str) -> str:
     """
     Returns the default file extension for a mimetype, or
@@ -442,6 +442,7 @@ def update_filename_and_move_files(sender, instance: Document, **kwargs):
             # Don't save() here to prevent infinite recursion.
             Document.objects.filter(pk=instance.pk).update(
                 filename=instance.filename,
+                filename_hash=Document.hash_filename(instance.filename),
                 archive_filename=instance.archive_filename,
             )
 
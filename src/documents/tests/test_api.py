@@ -3931,10 +3931,10 @@ class TestBulkDownload(DirectoriesMixin, APITestCase):
             self.assertIn("2021-01-01 document A.pdf", zipf.namelist())
             self.assertIn("2020-03-21 document B.jpg", zipf.namelist())
 
-            with self.doc2.source_file as f:
+            with self.doc2.open_source() as f:
                 self.assertEqual(f.read(), zipf.read("2021-01-01 document A.pdf"))
 
-            with self.doc3.source_file as f:
+            with self.doc3.open_source() as f:
                 self.assertEqual(f.read(), zipf.read("2020-03-21 document B.jpg"))
 
     def test_download_default(self):
@@ -3952,10 +3952,10 @@ class TestBulkDownload(DirectoriesMixin, APITestCase):
             self.assertIn("2021-01-01 document A.pdf", zipf.namelist())
             self.assertIn("2020-03-21 document B.pdf", zipf.namelist())
 
-            with self.doc2.source_file as f:
+            with self.doc2.open_source() as f:
                 self.assertEqual(f.read(), zipf.read("2021-01-01 document A.pdf"))
 
-            with self.doc3.archive_file as f:
+            with self.doc3.open_archive() as f:
                 self.assertEqual(f.read(), zipf.read("2020-03-21 document B.pdf"))
 
     def test_download_both(self):
@@ -3974,19 +3974,19 @@ class TestBulkDownload(DirectoriesMixin, APITestCase):
             self.assertIn("archive/2020-03-21 document B.pdf", zipf.namelist())
             self.assertIn("originals/2020-03-21 document B.jpg", zipf.namelist())
 
-            with self.doc2.source_file as f:
+            with self.doc2.open_source() as f:
                 self.assertEqual(
                     f.read(),
                     zipf.read("originals/2021-01-01 document A.pdf"),
                 )
 
-            with self.doc3.archive_file as f:
+            with self.doc3.open_archive() as f:
                 self.assertEqual(
                     f.read(),
                     zipf.read("archive/2020-03-21 document B.pdf"),
                 )
 
-            with self.doc3.source_file as f:
+            with self.doc3.open_source() as f:
                 self.assertEqual(
                     f.read(),
                     zipf.read("originals/2020-03-21 document B.jpg"),
@@ -4008,10 +4008,10 @@ class TestBulkDownload(DirectoriesMixin, APITestCase):
             self.assertIn("2021-01-01 document A.pdf", zipf.namelist())
             self.assertIn("2021-01-01 document A_01.pdf", zipf.namelist())
 
-            with self.doc2.source_file as f:
+            with self.doc2.open_source() as f:
                 self.assertEqual(f.read(), zipf.read("2021-01-01 document A.pdf"))
 
-            with self.doc2b.source_file as f:
+            with self.doc2b.open_source() as f:
                 self.assertEqual(f.read(), zipf.read("2021-01-01 document A_01.pdf"))
 
     def test_compression(self):
@@ -4066,10 +4066,10 @@ class TestBulkDownload(DirectoriesMixin, APITestCase):
             self.assertIn("a space name/Title 2 - Doc 3.jpg", zipf.namelist())
             self.assertIn("test/This is Doc 2.pdf", zipf.namelist())
 
-            with self.doc2.source_file as f:
+            with self.doc2.open_source() as f:
                 self.assertEqual(f.read(), zipf.read("test/This is Doc 2.pdf"))
 
-            with self.doc3.source_file as f:
+            with self.doc3.open_source() as f:
                 self.assertEqual(
                     f.read(),
                     zipf.read("a space name/Title 2 - Doc 3.jpg"),
@@ -4114,10 +4114,10 @@ class TestBulkDownload(DirectoriesMixin, APITestCase):
             self.assertIn("somewhere/This is Doc 2.pdf", zipf.namelist())
             self.assertIn("somewhere/Title 2 - Doc 3.pdf", zipf.namelist())
 
-            with self.doc2.source_file as f:
+            with self.doc2.open_source() as f:
                 self.assertEqual(f.read(), zipf.read("somewhere/This is Doc 2.pdf"))
 
-            with self.doc3.archive_file as f:
+            with self.doc3.open_archive() as f:
                 self.assertEqual(f.read(), zipf.read("somewhere/Title 2 - Doc 3.pdf"))
 
     @override_settings(FILENAME_FORMAT="{document_type}/{title}")
@@ -4164,19 +4164,19 @@ class TestBulkDownload(DirectoriesMixin, APITestCase):
             self.assertIn("archive/statement/Title 2 - Doc 3.pdf", zipf.namelist())
             self.assertIn("originals/statement/Title 2 - Doc 3.jpg", zipf.namelist())
 
-            with self.doc2.source_file as f:
+            with self.doc2.open_source() as f:
                 self.assertEqual(
                     f.read(),
                     zipf.read("originals/bill/This is Doc 2.pdf"),
                 )
 
-            with self.doc3.archive_file as f:
+            with self.doc3.open_archive() as f:
                 self.assertEqual(
                     f.read(),
                     zipf.read("archive/statement/Title 2 - Doc 3.pdf"),
                 )
 
-            with self.doc3.source_file as f:
+            with self.doc3.open_source() as f:
                 self.assertEqual(
                     f.read(),
                     zipf.read("originals/statement/Title 2 - Doc 3.jpg"),
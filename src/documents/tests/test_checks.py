@@ -33,10 +33,9 @@ class TestDocumentChecks(TestCase):
         PASSPHRASE="test",
     )
     @mock.patch("paperless.db.GnuPG.decrypted")
-    @mock.patch("documents.models.Document.source_file")
-    def test_encrypted_decrypt_fails(self, mock_decrypted, mock_source_file):
+    @mock.patch("documents.models.Document.open_source")
+    def test_encrypted_decrypt_fails(self, mock_open_source, mock_decrypted):
         mock_decrypted.return_value = None
-        mock_source_file.return_value = b""
 
         DocumentFactory.create(storage_type=Document.STORAGE_TYPE_GPG)
 
@@ -171,6 +171,61 @@ class TestFieldPermutations(TestCase):
             info = FileInfo.from_filename(filename)
             self.assertEqual(info.title, "anotherall")
 
+        # Multiple transformations configured (first pattern matches, but
+        # further into the filename than the second pattern)
+        with self.settings(
+            FILENAME_PARSE_TRANSFORMS=[
+                (re.compile("_(\\d{4})\\.pdf$"), "_\\1_first.pdf"),
+                (re.compile("^tag1"), "second"),
+            ],
+        ):
+            info = FileInfo.from_filename(filename)
+            self.assertEqual(info.title, "tag1,tag2_20190908_180610_0001_first")
+
+    def test_filename_parse_transforms_not_combinable(self):
+        filename = "tag1,tag2_20190908_180610_0001.pdf"
+        none_patt = re.compile("$a")
+
+        # Backreference by number
+        with self.settings(
+            FILENAME_PARSE_TRANSFORMS=[
+                (none_patt, "none.gif"),
+                (re.compile("^(tag)1,\\1"), "second"),
+            ],
+        ):
+            info = FileInfo.from_filename(filename)
+            self.assertEqual(info.title, "second2_20190908_180610_0001")
+
+        # Conditional on a group number
+        with self.settings(
+            FILENAME_PARSE_TRANSFORMS=[
+                (re.compile("\\d{2}"), "<0>"),
+                (re.compile("(a)(?(1)b|c)"), "<1>"),
+            ],
+        ):
+            info = FileInfo.from_filename("cab1.pdf")
+            self.assertEqual(info.title, "c<1>1")
+
+        # Inline global flag only applies to its own pattern
+        with self.settings(
+            FILENAME_PARSE_TRANSFORMS=[
+                (re.compile("(?i)^TAG9"), "first"),
+                (re.compile("TAG2"), "second"),
+            ],
+        ):
+            info = FileInfo.from_filename(filename)
+            self.assertEqual(info.title, "tag1,tag2_20190908_180610_0001")
+
+        # Same group name used in more than one pattern
+        with self.settings(
+            FILENAME_PARSE_TRANSFORMS=[
+                (re.compile("(?P<part>\\d{8})"), "date"),
+                (re.compile("^(?P<part>tag)1"), "second"),
+            ],
+        ):
+            info = FileInfo.from_filename(filename)
+            self.assertEqual(info.title, "tag1,tag2_date_180610_0001")
+
 
 class DummyParser(DocumentParser):
     def __init__(self, logging_group, scratch_dir, archive_path):
@@ -4,6 +4,7 @@ import zoneinfo
 from pathlib import Path
 from unittest import mock
 
+from django.db import IntegrityError
 from django.test import TestCase
 from django.test import override_settings
 from django.utils import timezone
@@ -47,6 +48,105 @@ class TestDocument(TestCase):
             mock_unlink.assert_any_call(thumb_path)
             self.assertEqual(mock_unlink.call_count, 2)
 
+    def test_source_path_cached(self):
+        document = Document(
+            pk=1,
+            title="Title",
+            checksum="checksum",
+            mime_type="application/pdf",
+        )
+
+        with mock.patch(
+            "documents.models.os.path.realpath",
+            side_effect=lambda path: path,
+        ) as mock_resolve:
+            self.assertEqual(
+                document.source_path,
+                Path(self.originals_dir) / "0000001.pdf",
+            )
+            self.assertEqual(
+                document.source_path,
+                Path(self.originals_dir) / "0000001.pdf",
+            )
+            self.assertEqual(mock_resolve.call_count, 1)
+
+            # Changing the filename must not return the stale path
+            document.filename = "other/name.pdf"
+            self.assertEqual(
+                document.source_path,
+                Path(self.originals_dir) / "other" / "name.pdf",
+            )
+            self.assertEqual(mock_resolve.call_count, 2)
+
+    def test_objects_with_related(self):
+        correspondent = Correspondent.objects.create(name="Test0")
+        for i in range(3):
+            Document.objects.create(
+                correspondent=correspondent,
+                title=f"Title {i}",
+                checksum=f"checksum{i}",
+                mime_type="application/pdf",
+            )
+
+        # One query for the documents and their foreign keys, one per
+        # prefetched relation
+        with self.assertNumQueries(3):
+            for document in Document.objects_with_related.all():
+                self.assertEqual(document.correspondent, correspondent)
+                self.assertEqual(list(document.tags.all()), [])
+                self.assertEqual(list(document.notes.all()), [])
+
+    def test_filename_hash(self):
+        document = Document.objects.create(
+            title="Title",
+            checksum="checksum",
+            mime_type="application/pdf",
+        )
+        self.assertIsNone(document.filename_hash)
+
+        document.filename = "dir/test.pdf"
+        document.save(update_fields=["filename"])
+        document.refresh_from_db()
+        self.assertEqual(
+            document.filename_hash,
+            Document.hash_filename("dir/test.pdf"),
+        )
+
+        with self.assertRaises(IntegrityError):
+            Document.objects.create(
+                title="Other",
+                checksum="other",
+                mime_type="application/pdf",
+                filename="dir/test.pdf",
+            )
+
+    def test_source_file_deprecated(self):
+        document = Document.objects.create(
+            title="Title",
+            checksum="checksum",
+            mime_type="application/pdf",
+        )
+        Path(document.source_path).write_bytes(b"content")
+
+        with document.open_source() as f:
+            self.assertEqual(f.read(), b"content")
+
+        with self.assertWarns(DeprecationWarning):
+            with document.source_file as f:
+                self.assertEqual(f.read(), b"content")
+
+    def test_str_no_correspondent_query(self):
+        Document.objects.create(
+            title="Title",
+            checksum="checksum",
+            mime_type="application/pdf",
+            created=timezone.datetime(2020, 12, 25, tzinfo=zoneinfo.ZoneInfo("UTC")),
+        )
+        document = Document.objects.get()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(str(document), "2020-12-25 Title")
+
     def test_file_name(self):
         doc = Document(
             mime_type="application/pdf",
@@ -11,9 +11,11 @@ from django.test import TestCase
 from django.test import override_settings
 from django.utils import timezone
 
+from documents import file_handling
 from documents.file_handling import create_source_path_directory
 from documents.file_handling import delete_empty_directories
 from documents.file_handling import generate_filename
+from documents.file_handling import generate_unique_filename
 from documents.models import Correspondent
 from documents.models import Document
 from documents.models import DocumentType
@@ -1157,3 +1159,30 @@ class TestFilenameGeneration(DirectoriesMixin, TestCase):
 
         self.assertEqual(generate_filename(text_doc), "logs.txt")
         self.assertEqual(generate_filename(text_doc, archive_filename=True), "logs.pdf")
+
+    @override_settings(FILENAME_FORMAT="{title}")
+    def test_unique_filename_formats_once(self):
+        """
+        GIVEN:
+            - A document whose formatted filename already exists, as does the
+              first counter suffixed variant
+        WHEN:
+            - A unique filename is generated for the document
+        THEN:
+            - The next free counter is used
+            - The filename format is only evaluated once
+        """
+        doc = Document.objects.create(
+            title="document",
+            mime_type="application/pdf",
+            checksum="1",
+        )
+        Path(settings.ORIGINALS_DIR, "document.pdf").touch()
+        Path(settings.ORIGINALS_DIR, "document_01.pdf").touch()
+
+        with mock.patch(
+            "documents.file_handling._format_filename_path",
+            wraps=file_handling._format_filename_path,
+        ) as m:
+            self.assertEqual(generate_unique_filename(doc), "document_02.pdf")
+        m.assert_called_once_with(doc)
@@ -31,15 +31,39 @@ class TestArchiver(DirectoriesMixin, FileSystemAssertsMixin, TestCase):
 
     def test_archiver(self):
         doc = self.make_models()
-        shutil.copy(
+        self._place_sample(
             sample_file,
             os.path.join(self.dirs.originals_dir, f"{doc.id:07}.pdf"),
         )
 
         call_command("document_archiver", "--processes", "1")
 
+    @mock.patch(
+        "documents.management.commands.document_archiver.update_document_archive_file",
+    )
+    def test_archiver_skips_archived(self, m):
+        doc = self.make_models()
+        archived = Document.objects.create(
+            checksum="B",
+            title="B",
+            content="second document",
+            mime_type="application/pdf",
+            archive_filename="B.pdf",
+        )
+
+        call_command("document_archiver", "--processes", "1")
+        m.assert_called_once_with(doc.pk)
+
+        m.reset_mock()
+        call_command("document_archiver", "--processes", "1", "--overwrite")
+        self.assertCountEqual(
+            [call.args[0] for call in m.call_args_list],
+            [doc.pk, archived.pk],
+        )
+
     def test_handle_document(self):
         doc = self.make_models()
+        # A real copy, the test checks that the original is left untouched
         shutil.copy(
             sample_file,
             os.path.join(self.dirs.originals_dir, f"{doc.id:07}.pdf"),
@@ -47,7 +71,7 @@ class TestArchiver(DirectoriesMixin, FileSystemAssertsMixin, TestCase):
 
         update_document_archive_file(doc.pk)
 
-        doc = Document.objects.get(id=doc.id)
+        doc.refresh_from_db(fields=["checksum", "archive_checksum", "archive_filename"])
 
         self.assertIsNotNone(doc.checksum)
         self.assertIsNotNone(doc.archive_checksum)
@@ -60,11 +84,11 @@ class TestArchiver(DirectoriesMixin, FileSystemAssertsMixin, TestCase):
         doc = self.make_models()
         doc.mime_type = "sdgfh"
         doc.save()
-        shutil.copy(sample_file, doc.source_path)
+        self._place_sample(sample_file, doc.source_path)
 
         update_document_archive_file(doc.pk)
 
-        doc = Document.objects.get(id=doc.id)
+        doc.refresh_from_db(fields=["checksum", "archive_checksum", "archive_filename"])
 
         self.assertIsNotNone(doc.checksum)
         self.assertIsNone(doc.archive_checksum)
@@ -87,8 +111,11 @@ class TestArchiver(DirectoriesMixin, FileSystemAssertsMixin, TestCase):
             mime_type="application/pdf",
             filename="document_01.pdf",
         )
-        shutil.copy(sample_file, os.path.join(self.dirs.originals_dir, "document.pdf"))
-        shutil.copy(
+        self._place_sample(
+            sample_file,
+            os.path.join(self.dirs.originals_dir, "document.pdf"),
+        )
+        self._place_sample(
             sample_file,
             os.path.join(self.dirs.originals_dir, "document_01.pdf"),
         )
@@ -96,22 +123,31 @@ class TestArchiver(DirectoriesMixin, FileSystemAssertsMixin, TestCase):
         update_document_archive_file(doc2.pk)
         update_document_archive_file(doc1.pk)
 
-        doc1 = Document.objects.get(id=doc1.id)
-        doc2 = Document.objects.get(id=doc2.id)
+        doc1.refresh_from_db(fields=["archive_filename"])
+        doc2.refresh_from_db(fields=["archive_filename"])
 
         self.assertEqual(doc1.archive_filename, "document.pdf")
         self.assertEqual(doc2.archive_filename, "document_01.pdf")
 
 
 class TestDecryptDocuments(FileSystemAssertsMixin, TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The command waits for confirmation before decrypting
+        input_patcher = mock.patch(
+            "documents.management.commands.decrypt_documents.input",
+        )
+        input_patcher.start()
+        cls.addClassCleanup(input_patcher.stop)
+
     @override_settings(
         ORIGINALS_DIR=os.path.join(os.path.dirname(__file__), "samples", "originals"),
         THUMBNAIL_DIR=os.path.join(os.path.dirname(__file__), "samples", "thumb"),
         PASSPHRASE="test",
         FILENAME_FORMAT=None,
     )
-    @mock.patch("documents.management.commands.decrypt_documents.input")
-    def test_decrypt(self, m):
+    def test_decrypt(self):
         media_dir = tempfile.mkdtemp()
         originals_dir = os.path.join(media_dir, "documents", "originals")
         thumb_dir = os.path.join(media_dir, "documents", "thumbnails")
@@ -132,7 +168,7 @@ class TestDecryptDocuments(FileSystemAssertsMixin, TestCase):
             storage_type=Document.STORAGE_TYPE_GPG,
         )
 
-        shutil.copy(
+        self._place_sample(
             os.path.join(
                 os.path.dirname(__file__),
                 "samples",
@@ -142,7 +178,7 @@ class TestDecryptDocuments(FileSystemAssertsMixin, TestCase):
             ),
             os.path.join(originals_dir, "0000004.pdf.gpg"),
         )
-        shutil.copy(
+        self._place_sample(
             os.path.join(
                 os.path.dirname(__file__),
                 "samples",
@@ -164,9 +200,11 @@ class TestDecryptDocuments(FileSystemAssertsMixin, TestCase):
         self.assertIsFile(os.path.join(thumb_dir, f"{doc.id:07}.webp"))
         self.assertIsFile(doc.thumbnail_path)
 
-        with doc.source_file as f:
-            checksum = hashlib.md5(f.read()).hexdigest()
-            self.assertEqual(checksum, doc.checksum)
+        checksum = hashlib.md5()
+        with doc.open_source() as f:
+            for chunk in iter(lambda: f.read(256 * 1024), b""):
+                checksum.update(chunk)
+        self.assertEqual(checksum.hexdigest(), doc.checksum)
 
 
 class TestMakeIndex(TestCase):
@@ -189,20 +227,22 @@ class TestRenamer(DirectoriesMixin, FileSystemAssertsMixin, TestCase):
         doc.archive_filename = generate_filename(doc, archive_filename=True)
         doc.save()
 
-        Path(doc.source_path).touch()
-        Path(doc.archive_path).touch()
+        old_source_path = doc.source_path
+        old_archive_path = doc.archive_path
+        Path(old_source_path).touch()
+        Path(old_archive_path).touch()
 
         with override_settings(FILENAME_FORMAT="{correspondent}/{title}"):
             call_command("document_renamer")
 
-        doc2 = Document.objects.get(id=doc.id)
+        doc.refresh_from_db(fields=["filename", "archive_filename"])
 
-        self.assertEqual(doc2.filename, "none/test.jpg")
-        self.assertEqual(doc2.archive_filename, "none/test.pdf")
-        self.assertIsNotFile(doc.source_path)
-        self.assertIsNotFile(doc.archive_path)
-        self.assertIsFile(doc2.source_path)
-        self.assertIsFile(doc2.archive_path)
+        self.assertEqual(doc.filename, "none/test.jpg")
+        self.assertEqual(doc.archive_filename, "none/test.pdf")
+        self.assertIsNotFile(old_source_path)
+        self.assertIsNotFile(old_archive_path)
+        self.assertIsFile(doc.source_path)
+        self.assertIsFile(doc.archive_path)
 
 
 class TestCreateClassifier(TestCase):
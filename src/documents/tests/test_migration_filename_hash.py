@@ -0,0 +1,31 @@
+import hashlib
+
+from documents.tests.utils import DirectoriesMixin
+from documents.tests.utils import TestMigrations
+
+
+class TestMigrateFilenameHash(DirectoriesMixin, TestMigrations):
+    migrate_from = "1043_trigram_indexes"
+    migrate_to = "1044_document_filename_hash"
+
+    def setUpBeforeMigration(self, apps):
+        Document = apps.get_model("documents", "Document")
+        self.doc_id = Document.objects.create(
+            title="test",
+            checksum="A",
+            mime_type="application/pdf",
+            filename="dir/test.pdf",
+        ).id
+        self.doc_no_file_id = Document.objects.create(
+            title="test",
+            checksum="B",
+            mime_type="application/pdf",
+        ).id
+
+    def testFilenameHashSet(self):
+        Document = self.apps.get_model("documents", "Document")
+        self.assertEqual(
+            Document.objects.get(id=self.doc_id).filename_hash,
+            hashlib.blake2b(b"dir/test.pdf", digest_size=16).hexdigest(),
+        )
+        self.assertIsNone(Document.objects.get(id=self.doc_no_file_id).filename_hash)
@@ -1,3 +1,7 @@
+import filecmp
+import hashlib
+import os
+import random
 import shutil
 import tempfile
 import time
@@ -9,6 +13,7 @@ from os import PathLike
 from pathlib import Path
 from typing import Any
 from typing import Callable
+from typing import Optional
 from typing import Union
 from unittest import mock
 
@@ -24,26 +29,55 @@ from documents.data_models import ConsumableDocument
 from documents.data_models import DocumentMetadataOverrides
 from documents.parsers import ParseError
 
+# Sample fixtures are only ever read by the tests, so when they live on the same
+# device as the temporary directories they can be hardlinked into place
+_SAMPLES_DIR = Path(__file__).parent / "samples"
+_CAN_LINK_SAMPLES = (
+    os.stat(_SAMPLES_DIR).st_dev == os.stat(tempfile.gettempdir()).st_dev
+)
 
-def setup_directories():
+# Below this size a direct byte comparison is cheaper than hashing both files
+_SMALL_FILE_SIZE = 1024 * 1024
+_HASH_CHUNK_SIZE = 256 * 1024
+
+
+def _hash_file(path: Path) -> str:
+    """
+    Streams the file through BLAKE2b in chunks, so even large files are hashed
+    without reading them fully into memory
+    """
+    h = hashlib.blake2b()
+    with path.open("rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def setup_directories(root_dir: Optional[Path] = None):
     dirs = namedtuple("Dirs", ())
 
-    dirs.data_dir = Path(tempfile.mkdtemp())
-    dirs.scratch_dir = Path(tempfile.mkdtemp())
-    dirs.media_dir = Path(tempfile.mkdtemp())
-    dirs.consumption_dir = Path(tempfile.mkdtemp())
-    dirs.static_dir = Path(tempfile.mkdtemp())
+    # A single temporary root keeps setup and cleanup to one mkdtemp/rmtree
+    dirs.root_dir = root_dir if root_dir is not None else Path(tempfile.mkdtemp())
+    dirs.data_dir = dirs.root_dir / "data"
+    dirs.scratch_dir = dirs.root_dir / "scratch"
+    dirs.media_dir = dirs.root_dir / "media"
+    dirs.consumption_dir = dirs.root_dir / "consume"
+    dirs.static_dir = dirs.root_dir / "static"
     dirs.index_dir = dirs.data_dir / "index"
     dirs.originals_dir = dirs.media_dir / "documents" / "originals"
     dirs.thumbnail_dir = dirs.media_dir / "documents" / "thumbnails"
     dirs.archive_dir = dirs.media_dir / "documents" / "archive"
     dirs.logging_dir = dirs.data_dir / "log"
 
-    dirs.index_dir.mkdir(parents=True, exist_ok=True)
-    dirs.originals_dir.mkdir(parents=True, exist_ok=True)
-    dirs.thumbnail_dir.mkdir(parents=True, exist_ok=True)
-    dirs.archive_dir.mkdir(parents=True, exist_ok=True)
-    dirs.logging_dir.mkdir(parents=True, exist_ok=True)
+    # The index is created by the application when first needed, so tests
+    # which never search or index don't create it
+    dirs.scratch_dir.mkdir()
+    dirs.consumption_dir.mkdir()
+    dirs.static_dir.mkdir()
+    dirs.originals_dir.mkdir(parents=True)
+    dirs.thumbnail_dir.mkdir()
+    dirs.archive_dir.mkdir()
+    dirs.logging_dir.mkdir(parents=True)
 
     dirs.settings_override = override_settings(
         DATA_DIR=dirs.data_dir,
@@ -65,11 +99,7 @@ def setup_directories():
 
 
 def remove_dirs(dirs):
-    shutil.rmtree(dirs.media_dir, ignore_errors=True)
-    shutil.rmtree(dirs.data_dir, ignore_errors=True)
-    shutil.rmtree(dirs.scratch_dir, ignore_errors=True)
-    shutil.rmtree(dirs.consumption_dir, ignore_errors=True)
-    shutil.rmtree(dirs.static_dir, ignore_errors=True)
+    shutil.rmtree(dirs.root_dir, ignore_errors=True)
     dirs.settings_override.disable()
 
 
@@ -99,24 +129,25 @@ def util_call_with_backoff(
     periods between each attempt, in hopes the issue resolves itself during
     one attempt to parse.
 
-    This will wait the following:
-        - Attempt 1 - 20s following failure
-        - Attempt 2 - 40s following failure
-        - Attempt 3 - 80s following failure
+    Each wait is the current backoff period scaled by a random factor between
+    1 and 3, so parallel test runs don't retry in lockstep, and capped at 120s.
+    The backoff starts at 20s in CI and at 5s otherwise, doubling after each
+    failure.  There is no wait after the final attempt.
 
     """
     result = None
     succeeded = False
-    retry_time = 20.0
-    retry_count = 0
+    retry_time = 20.0 if os.environ.get("CI") else 5.0
+    max_retry_time = 120.0
     status_codes = []
     max_retry_count = 3
 
-    while retry_count < max_retry_count and not succeeded:
+    for attempt in range(max_retry_count):
         try:
             result = method_or_callable(*args)
 
             succeeded = True
+            break
         except ParseError as e:  # pragma: no cover
             cause_exec = e.__cause__
             if cause_exec is not None and isinstance(cause_exec, httpx.HTTPStatusError):
@@ -129,10 +160,9 @@ def util_call_with_backoff(
         except Exception as e:  # pragma: no cover
             warnings.warn(f"Unexpected error: {e}")
 
-        retry_count = retry_count + 1
-
-        time.sleep(retry_time)
-        retry_time = retry_time * 2.0
+        if attempt < max_retry_count - 1:  # pragma: no cover
+            time.sleep(min(max_retry_time, retry_time * random.uniform(1, 3)))
+            retry_time = retry_time * 2.0
 
     if (
         not succeeded
@@ -149,28 +179,60 @@ class DirectoriesMixin:
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.dirs = None
+        self._tmp_path = None
+
+    @pytest.fixture(autouse=True)
+    def directories_tmp_path(self, tmp_path: Path):
+        """
+        Places the directories under pytest's tmp_path. pytest removes those
+        along with old sessions, so tearDown doesn't have to delete them.
+        Without pytest, the directories are created and removed per test
+        """
+        self._tmp_path = tmp_path
 
     def setUp(self) -> None:
-        self.dirs = setup_directories()
+        self.dirs = setup_directories(self._tmp_path)
         super().setUp()
 
     def tearDown(self) -> None:
         super().tearDown()
-        remove_dirs(self.dirs)
+        if self._tmp_path is None:
+            remove_dirs(self.dirs)
+        else:
+            self.dirs.settings_override.disable()
+            # tmp_path is used up, a repeated setUp gets its own directories
+            self._tmp_path = None
 
 
 class FileSystemAssertsMixin:
+    def _place_sample(
+        self,
+        src: Union[PathLike, str],
+        dst: Union[PathLike, str],
+    ) -> None:
+        """
+        Places a read-only sample file at the given destination, hardlinking
+        it when possible and falling back to a copy otherwise
+        """
+        if _CAN_LINK_SAMPLES:
+            try:
+                os.link(src, dst)
+                return
+            except OSError:
+                pass
+        shutil.copyfile(src, dst)
+
     def assertIsFile(self, path: Union[PathLike, str]):
-        self.assertTrue(Path(path).resolve().is_file(), f"File does not exist: {path}")
+        self.assertTrue(os.path.isfile(path), f"File does not exist: {path}")
 
     def assertIsNotFile(self, path: Union[PathLike, str]):
-        self.assertFalse(Path(path).resolve().is_file(), f"File does exist: {path}")
+        self.assertFalse(os.path.isfile(path), f"File does exist: {path}")
 
     def assertIsDir(self, path: Union[PathLike, str]):
-        self.assertTrue(Path(path).resolve().is_dir(), f"Dir does not exist: {path}")
+        self.assertTrue(os.path.isdir(path), f"Dir does not exist: {path}")
 
     def assertIsNotDir(self, path: Union[PathLike, str]):
-        self.assertFalse(Path(path).resolve().is_dir(), f"Dir does exist: {path}")
+        self.assertFalse(os.path.isdir(path), f"Dir does exist: {path}")
 
     def assertFilesEqual(
         self,
@@ -179,26 +241,37 @@ class FileSystemAssertsMixin:
     ):
         path1 = Path(path1)
         path2 = Path(path2)
-        import hashlib
 
-        hash1 = hashlib.sha256(path1.read_bytes()).hexdigest()
-        hash2 = hashlib.sha256(path2.read_bytes()).hexdigest()
+        # Hardlinks (or the same path twice) are trivially equal
+        if os.path.samefile(path1, path2):
+            return
 
-        self.assertEqual(hash1, hash2, "File SHA256 mismatch")
+        size1 = path1.stat().st_size
+        size2 = path2.stat().st_size
+        self.assertEqual(size1, size2, "File size mismatch")
+
+        if size1 < _SMALL_FILE_SIZE:
+            self.assertTrue(
+                filecmp.cmp(path1, path2, shallow=False),
+                "File content mismatch",
+            )
+        else:
+            self.assertEqual(
+                _hash_file(path1),
+                _hash_file(path2),
+                "File hash mismatch",
+            )
 
 
 class ConsumerProgressMixin:
     def setUp(self) -> None:
-        self.send_progress_patcher = mock.patch(
+        send_progress_patcher = mock.patch(
             "documents.consumer.Consumer._send_progress",
         )
-        self.send_progress_mock = self.send_progress_patcher.start()
+        self.send_progress_mock = send_progress_patcher.start()
+        self.addCleanup(send_progress_patcher.stop)
         super().setUp()
 
-    def tearDown(self) -> None:
-        super().tearDown()
-        self.send_progress_patcher.stop()
-
 
 class DocumentConsumeDelayMixin:
     """
@@ -207,14 +280,11 @@ class DocumentConsumeDelayMixin:
     """
 
     def setUp(self) -> None:
-        self.consume_file_patcher = mock.patch("documents.tasks.consume_file.delay")
-        self.consume_file_mock = self.consume_file_patcher.start()
+        consume_file_patcher = mock.patch("documents.tasks.consume_file.delay")
+        self.consume_file_mock = consume_file_patcher.start()
+        self.addCleanup(consume_file_patcher.stop)
         super().setUp()
 
-    def tearDown(self) -> None:
-        super().tearDown()
-        self.consume_file_patcher.stop()
-
     def get_last_consume_delay_call_args(
         self,
     ) -> tuple[ConsumableDocument, DocumentMetadataOverrides]:
@@ -290,9 +360,9 @@ class TestMigrations(TransactionTestCase):
             self.performMigration()
 
     def performMigration(self):
-        # Run the migration to test
+        # Run the migration to test. A new executor loads a fresh migration
+        # graph, so there is no need to rebuild it again here
         executor = MigrationExecutor(connection)
-        executor.loader.build_graph()  # reload.
         executor.migrate(self.migrate_to)
 
         self.apps = executor.loader.project_state(self.migrate_to).apps
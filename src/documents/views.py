@@ -283,7 +283,9 @@ class DocumentViewSet(
     )
 
     def get_queryset(self):
-        return Document.objects.distinct().annotate(num_notes=Count("notes"))
+        return Document.objects_with_related.distinct().annotate(
+            num_notes=Count("notes"),
+        )
 
     def get_serializer(self, *args, **kwargs):
         fields_param = self.request.query_params.get("fields", None)
@@ -455,10 +457,11 @@ class DocumentViewSet(
                 doc,
             ):
                 return HttpResponseForbidden("Insufficient permissions")
-            if doc.storage_type == Document.STORAGE_TYPE_GPG:
-                handle = GnuPG.decrypted(doc.thumbnail_file)
-            else:
-                handle = doc.thumbnail_file
+            with doc.open_thumbnail() as file_handle:
+                if doc.storage_type == Document.STORAGE_TYPE_GPG:
+                    handle = GnuPG.decrypted(file_handle)
+                else:
+                    handle = file_handle.read()
             # TODO: Send ETag information and use that to send new thumbnails
             #  if available
 
@@ -1265,21 +1268,24 @@ class SharedLinkView(View):
 
 def serve_file(doc: Document, use_archive: bool, disposition: str):
     if use_archive:
-        file_handle = doc.archive_file
+        open_file = doc.open_archive
         filename = doc.get_public_filename(archive=True)
         mime_type = "application/pdf"
     else:
-        file_handle = doc.source_file
+        open_file = doc.open_source
         filename = doc.get_public_filename()
         mime_type = doc.mime_type
         # Support browser previewing csv files by using text mime type
         if mime_type in {"application/csv", "text/csv"} and disposition == "inline":
             mime_type = "text/plain"
 
-    if doc.storage_type == Document.STORAGE_TYPE_GPG:
-        file_handle = GnuPG.decrypted(file_handle)
+    with open_file() as file_handle:
+        if doc.storage_type == Document.STORAGE_TYPE_GPG:
+            content = GnuPG.decrypted(file_handle)
+        else:
+            content = file_handle.read()
 
-    response = HttpResponse(file_handle, content_type=mime_type)
+    response = HttpResponse(content, content_type=mime_type)
     # Firefox is not able to handle unicode characters in filename field
     # RFC 5987 addresses this issue
     # see https://datatracker.ietf.org/doc/html/rfc5987#section-4.2
@@ -3,6 +3,7 @@ import os
 import re
 import subprocess
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -14,6 +15,15 @@ from documents.parsers import ParseError
 from documents.parsers import make_thumbnail_from_pdf
 
 
+@lru_cache(maxsize=8)
+def _parse_user_args(user_args: str) -> dict:
+    """
+    OCR_USER_ARGS only changes with the configuration, so the parsed JSON is
+    reused instead of decoding it again for every document
+    """
+    return json.loads(user_args)
+
+
 class NoTextFoundException(Exception):
     pass
 
@@ -256,7 +266,7 @@ class RasterisedDocumentParser(DocumentParser):
 
         if settings.OCR_USER_ARGS and not safe_fallback:
             try:
-                user_args = json.loads(settings.OCR_USER_ARGS)
+                user_args = _parse_user_args(settings.OCR_USER_ARGS)
                 ocrmypdf_args = {**ocrmypdf_args, **user_args}
             except Exception as e:
                 self.log.warning(
@@ -809,6 +809,18 @@ class TestParser(DirectoriesMixin, FileSystemAssertsMixin, TestCase):
             params = parser.construct_ocrmypdf_parameters("", "", "", "")
             self.assertNotIn("max_image_mpixels", params)
 
+        with override_settings(OCR_USER_ARGS='{"jbig2_lossy": true}'):
+            params = parser.construct_ocrmypdf_parameters("", "", "", "")
+            self.assertTrue(params["jbig2_lossy"])
+
+        with override_settings(OCR_USER_ARGS='{"jbig2_lossy": false}'):
+            params = parser.construct_ocrmypdf_parameters("", "", "", "")
+            self.assertFalse(params["jbig2_lossy"])
+
+        with override_settings(OCR_USER_ARGS="not json"):
+            params = parser.construct_ocrmypdf_parameters("", "", "", "")
+            self.assertNotIn("jbig2_lossy", params)
+
     def test_rtl_language_detection(self):
         """
         GIVEN: